@@ -1,18 +1,143 @@
 from typing import Callable, Union
+from collections import deque, namedtuple
+from functools import lru_cache
+from array import array
 import pygame
 import difflib
 import math as m
+import numpy as np
 
 pygame.init()
 
 __all__ = ["Renderer"]
 
+# vertex count from which transforms are done with numpy
+_NUMPY_THRESHOLD = 32
+# maximum number of rendered text labels kept in cache
+_TEXT_CACHE_SIZE = 256
+
+# dirty rects count from which the whole window is updated at once
+_DIRTY_RECTS_LIMIT = 256
+
+# frame rate from which frames are timed with a busy loop
+_BUSY_LOOP_FPS = 120
+
+# radians to degrees conversion factor
+_RAD_TO_DEG = 180 / m.pi
+
+# active transformations bits
+_SCALE = 1
+_ROTATION = 2
+_TRANSLATION = 4
+
 import __main__  # type: ignore (pylance bad)
 
 from ..data import *
 from ..pmath import *
 from ..elements import *
 
+# color names are all lowercase, matched against by difflib
+_COLOR_NAMES = tuple(COLORS)
+
+# renderer state saved by push, in the order pop restores it
+_RendererState = namedtuple("_RendererState", [
+    "fill_color", "has_fill", "stroke_color", "stroke_weight", "has_stroke",
+    "has_translation", "x_offset", "y_offset", "has_rotation", "rot_angle",
+    "has_scale", "scale_factor", "rect_mode", "translation_behavior",
+    "rotation_behavior", "scale_behavior", "text_color", "text_size"
+])
+
+
+@lru_cache(maxsize=512)
+def _closest_color(name: str) -> str:
+    """
+    gets the closest valid color name\\
+    cached so that each misspelled name is only matched once
+
+    Parameters
+    ----------
+        name : str
+            lowercase color name
+
+    Returns
+    -------
+        str : closest color name
+    """
+    return difflib.get_close_matches(name, _COLOR_NAMES, n=1, cutoff=.5)[0]
+
+
+@lru_cache(maxsize=None)
+def _match_font(name: str) -> Union[str, None]:
+    """
+    gets the path of a system font\\
+    cached so that system fonts are only looked up once per name
+
+    Parameters
+    ----------
+        name : str
+            name of the system font
+
+    Returns
+    -------
+        str | None : path of the font, None for the default font
+    """
+    return pygame.font.match_font(name)
+
+
+def _xy(point: Union[tuple, list, Vector]) -> tuple:
+    """
+    gets the first two coordinates of a point\\
+    2D tuples are returned as is, without any copy
+
+    Parameters
+    ----------
+        point : tuple | list | Vector
+            the point
+
+    Returns
+    -------
+        tuple : 2D point
+    """
+    if type(point) is tuple and len(point) == 2:
+        return point
+    return point[0], point[1]
+
+
+def _resolve_color(
+        color: Union[tuple[int, int, int], int, str]) -> tuple[int, int, int]:
+    """
+    gets the rgb tuple of a color parameter\\
+    uses the closest match if the color name is not valid
+
+    Parameters
+    ----------
+        color : tuple | int | str
+            the color
+
+    Returns
+    -------
+        tuple | None : rgb color, None if not a valid color parameter
+    """
+    if isinstance(color, tuple) and len(color) == 3:
+        return color
+    if isinstance(color, int):
+        return color, color, color
+    if isinstance(color, str):
+        # most names are already lowercase, only lower them on a miss
+        rgb = COLORS.get(color)
+        if rgb is not None:
+            return rgb
+        name = color.lower()
+        rgb = COLORS.get(name)
+        if rgb is None:
+            close = _closest_color(name)
+            warn(
+                f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
+            )
+            rgb = COLORS[close]
+        return rgb
+    return None
+
 
 class Renderer:
     """
@@ -117,7 +242,19 @@ class Renderer:
         self._title = (title, "Pygame Engine with Python")[title is None]
         pygame.display.set_caption(self._title)
 
-        self.font = pygame.font.SysFont("comicsans", 11)
+        # areas drawn since the last display update
+        self._full_redraw = True
+        self._dirty_rects: list[pygame.Rect] = []
+
+        # fonts and rendered text labels cache
+        self._fonts: dict[tuple[str, bool, int], pygame.font.Font] = {}
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+
+        # text labels waiting to be drawn in a single blits call
+        self._is_batching = False
+        self._pending_blits: list[tuple[pygame.Surface, tuple]] = []
+
+        self.font = self._get_font("comicsans", True, 11)
         self._ff_name = "comicsans"
         self._ff_is_sys = True
 
@@ -128,22 +265,32 @@ class Renderer:
         self._stroke_weight = 1
         self._stroke = True
         self._rect_mode = CORNER
+        # both stroking and filling disabled
+        self._needs_draw_debug = False
 
         # offsets
         self._has_translation = False
         self._x_offset = 0
         self._y_offset = 0
         self._translation_behavior = RESET
+        self._resets_translation = True
 
         # angles
         self._has_rotation = False
         self._rot_angle = 0
         self._rotation_behavior = RESET
+        self._resets_rotation = True
 
         # scale
         self._has_scale = False
         self._scale_factor = 1
         self._scale_behavior = RESET
+        self._resets_scale = True
+
+        # combined transform matrix (a, b, c, d, tx, ty) and scale in use
+        self._matrix = (1, 0, 0, 1, 0, 0)
+        self._matrix_scale = 1
+        self._xform_flags = 0
 
         # background
         self._has_auto_bg = False
@@ -151,7 +298,7 @@ class Renderer:
 
         # shapes
         self._is_drawing_shape = False
-        self._all_vertexes: list[tuple] = []
+        self._all_vertexes = array("d")
 
         # text management
         self._text_color = (255, 255, 255)
@@ -159,16 +306,23 @@ class Renderer:
 
         # buttons management
         self._has_buttons = False
-        self._all_buttons: set[Button] = set()
+        self._all_buttons: list[Button] = []
+        self._buttons_by_name: dict[str, list[Button]] = {}
+        self._visible_buttons: list[Button] = []
 
         # sliders management
         self._has_sliders = False
-        self._all_sliders: set[Slider] = set()
+        self._all_sliders: list[Slider] = []
+        self._sliders_by_name: dict[str, list[Slider]] = {}
+        self._visible_sliders: list[Slider] = []
 
         # menus management
-        self._has_left_menu = False
-        self._has_right_menu = False
-        self._all_menus: set[Menu] = set()
+        self._menu_count = 0
+        self._left_menu: Menu = None
+        self._right_menu: Menu = None
+        self._all_menus: list[Menu] = []
+        self._menus_by_name: dict[str, list[Menu]] = {}
+        self._visible_menus: list[Menu] = []
 
         # scrollbar management
         self._has_scrollbar = False
@@ -182,18 +336,17 @@ class Renderer:
         # fps
         self._fps = 60
         self._clock = pygame.time.Clock()
+        self._tick = self._clock.tick
 
         # save
         self._has_save = False
-        # list[list[tuple[int, int, int], bool, tuple[int, int, int], int, bool, bool, int, int, bool,
-        #           Union[int, float], bool, Union[int, float], str, str, str, str, tuple[int, int, int], int]]
-        self._save: list[list[18]] = []
+        self._save: deque[_RendererState] = deque()
 
         # keys
-        self._key_binding: dict[int, int] = {}
-        self._actions: list[Callable[[], None]] = []
-        self._keys_behavior: list[str] = []
-        self._pressed: dict[int, bool] = {}
+        self._key_actions: dict[int, Callable[[], None]] = {}
+        self._key_behaviors: dict[int, str] = {}
+        # HOLD keys currently held down
+        self._held_keys: set[int] = set()
         self.keys = Keys()
 
         # bench mode
@@ -281,6 +434,7 @@ class Renderer:
         disables filling globally
         """
         self._fill = False
+        self._needs_draw_debug = not self._stroke
 
     @property
     def fill(self) -> tuple[int, int, int]:
@@ -304,32 +458,21 @@ class Renderer:
                 the new color
         """
         self._fill = True
-        if isinstance(color, tuple) and len(color) == 3:
-            self._fill_color = color
-        elif isinstance(color, int):
-            self._fill_color = color, color, color
-        elif isinstance(color, str):
-            try:
-                self._fill_color = COLORS[color.lower()]
-            except KeyError:
-                close = difflib.get_close_matches(color.lower(),
-                                                  COLORS.keys(),
-                                                  n=1,
-                                                  cutoff=.5)[0]
-                warn(
-                    f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
-                )
-                self._fill_color = COLORS[close]
-        else:
+        self._needs_draw_debug = False
+        rgb = _resolve_color(color)
+        if rgb is None:
             warn(
                 f"ERROR [renderer] : {color} not a valid color parameter, nothing changed"
             )
+            return
+        self._fill_color = rgb
 
     def no_stroke(self) -> None:
         """
         disables stroking globally
         """
         self._stroke = False
+        self._needs_draw_debug = not self._fill
 
     @property
     def stroke(self) -> tuple[int, int, int]:
@@ -353,26 +496,14 @@ class Renderer:
                 the new color
         """
         self._stroke = True
-        if isinstance(color, tuple) and len(color) == 3:
-            self._stroke_color = color
-        elif isinstance(color, int):
-            self._stroke_color = color, color, color
-        elif isinstance(color, str):
-            try:
-                self._stroke_color = COLORS[color.lower()]
-            except KeyError:
-                close = difflib.get_close_matches(color.lower(),
-                                                  COLORS.keys(),
-                                                  n=1,
-                                                  cutoff=.5)[0]
-                warn(
-                    f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
-                )
-                self._stroke_color = COLORS[close]
-        else:
+        self._needs_draw_debug = False
+        rgb = _resolve_color(color)
+        if rgb is None:
             warn(
                 f"ERROR [renderer] : {color} not a valid color parameter, nothing changed"
             )
+            return
+        self._stroke_color = rgb
 
     @property
     def stroke_weight(self) -> int:
@@ -396,6 +527,7 @@ class Renderer:
                 new stroke weight
         """
         self._stroke = True
+        self._needs_draw_debug = False
         self._stroke_weight = weight
 
     @property
@@ -442,10 +574,7 @@ class Renderer:
                 new text size
         """
         self._text_size = size
-        if self._ff_is_sys:
-            self.font = pygame.font.SysFont(self._ff_name, size)
-        else:
-            self.font = pygame.font.Font(self._ff_name, size)
+        self.font = self._get_font(self._ff_name, self._ff_is_sys, size)
 
     @property
     def text_font(self) -> str:
@@ -480,11 +609,38 @@ class Renderer:
         if name is not None:
             self._ff_name = name
             self._ff_is_sys = True
-            self.font = pygame.font.SysFont(self._ff_name, size)
+            self.font = self._get_font(self._ff_name, True, size)
         elif path is not None:
             self._ff_name = path
             self._ff_is_sys = False
-            self.font = pygame.font.Font(self._ff_name, size)
+            self.font = self._get_font(self._ff_name, False, size)
+
+    def _get_font(self, name: str, is_sys: bool, size: int) -> pygame.font.Font:
+        """
+        Gets a font from the cache, loads it only once per name and size
+
+        Parameters
+        ----------
+            name : str
+                name of the font if system path otherwise
+            is_sys : bool
+                if the font is a system font
+            size : int
+                size of the font
+
+        Returns
+        -------
+            pygame.font.Font : matching font
+        """
+        key = name, is_sys, size
+        font = self._fonts.get(key)
+        if font is None:
+            if is_sys:
+                font = pygame.font.Font(_match_font(name), size)
+            else:
+                font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
 
     @property
     def text_color(self) -> tuple[int, int, int]:
@@ -503,26 +659,13 @@ class Renderer:
             color : tuple | int | str
                 the new color
         """
-        if isinstance(color, tuple) and len(color) == 3:
-            self._text_color = color
-        elif isinstance(color, int):
-            self._text_color = color, color, color
-        elif isinstance(color, str):
-            try:
-                self._text_color = COLORS[color.lower()]
-            except KeyError:
-                close = difflib.get_close_matches(color.lower(),
-                                                  COLORS.keys(),
-                                                  n=1,
-                                                  cutoff=.5)[0]
-                warn(
-                    f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
-                )
-                self._text_color = COLORS[close]
-        else:
+        rgb = _resolve_color(color)
+        if rgb is None:
             warn(
                 f"ERROR [renderer] : {color} not a valid color parameter, nothing changed"
             )
+            return
+        self._text_color = rgb
 
     @property
     def pixels(self) -> pygame.PixelArray:
@@ -560,16 +703,19 @@ class Renderer:
         if not self._is_drawing_shape:
             warn(f"ERROR [renderer] : not drawing shape, nothing happened")
             return
+        # coordinates are stored interleaved as x0, y0, x1, y1...
+        vertexes = self._all_vertexes
         if closed:
-            self._all_vertexes.append(self._all_vertexes[0])
+            vertexes.extend(vertexes[:2])
+        points = list(zip(vertexes[::2], vertexes[1::2]))
 
         if filled:
-            self.polygon(*self._all_vertexes)
+            self.polygon(*points)
         elif not filled:
-            self.lines(*self._all_vertexes, closed=False)
+            self.lines(*points, closed=False)
 
         self._is_drawing_shape = False
-        self._all_vertexes = []
+        del self._all_vertexes[:]
 
     def vertex(self, point: Union[tuple, list, Vector]):
         """
@@ -583,7 +729,9 @@ class Renderer:
         if not self._is_drawing_shape:
             warn(f"ERROR [renderer] : not drawing shape, nothing happened")
             return
-        self._all_vertexes.append(point)
+        vertexes = self._all_vertexes
+        vertexes.append(point[0])
+        vertexes.append(point[1])
 
     def _debug_enabled_drawing_methods(self) -> None:
         """
@@ -595,33 +743,38 @@ class Renderer:
                 f"ERROR [renderer] : stroking and filling both set to False, stroking is now enabled"
             )
             self._stroke = True
+            self._needs_draw_debug = False
             if self.stroke_weight <= 0:
                 warn(
                     f"ERROR [renderer] : stroke weight set to {self.stroke_weight}, stroke weight is now 1"
                 )
                 self.stroke_weight = 1
 
-    def _offset_point(self, point: tuple) -> list[float, float]:
+    def _update_matrix(self) -> None:
         """
-        Offsets a point based on _x_offset and _y_offset
-
-        Parameters
-        ----------
-            point : tuple
-                the point to apply the transformation
-
-        Returns
-        -------
-            list : transformed point
+        Recomputes the combined transform matrix\\
+        scale first, then rotation, then translation\\
+        must be called every time the transform state changes
         """
-        point = list(point)
-        new_point = [point[0] + self._x_offset, point[1] + self._y_offset]
-        return new_point
+        s = self._scale_factor if self._has_scale else 1
+        if self._has_rotation:
+            cos, sin = m.cos(self._rot_angle), m.sin(self._rot_angle)
+        else:
+            cos, sin = 1, 0
+        if self._has_translation:
+            tx, ty = self._x_offset, self._y_offset
+        else:
+            tx, ty = 0, 0
+        self._matrix = (s * cos, -s * sin, s * sin, s * cos, tx, ty)
+        self._matrix_scale = s
+        flags = ((_SCALE if self._has_scale else 0)
+                 | (_ROTATION if self._has_rotation else 0)
+                 | (_TRANSLATION if self._has_translation else 0))
+        self._xform_flags = flags
 
-    def _rotate_point(self, point: tuple) -> list[float, float]:
+    def _transform_point(self, point: tuple) -> tuple[float, float]:
         """
-        Rotates a point based on _rot_angle in radians\\
-        relatives to the axis origin
+        Applies scale, rotation and translation to a point in one pass
 
         Parameters
         ----------
@@ -630,36 +783,39 @@ class Renderer:
 
         Returns
         -------
-            list : transformed point
+            tuple : transformed point
         """
-        point = list(point)
-        new_point = [
-            point[0] * m.cos(self._rot_angle) -
-            point[1] * m.sin(self._rot_angle),
-            point[0] * m.sin(self._rot_angle) +
-            point[1] * m.cos(self._rot_angle)
-        ]
-        return new_point
+        a, b, c, d, tx, ty = self._matrix
+        x, y = point[0], point[1]
+        return a * x + b * y + tx, c * x + d * y + ty
 
-    def _scale_point(self, point: tuple) -> list[float, float]:
+    def _transform_points(self, points: list) -> list[tuple[float, float]]:
         """
-        Scales a point based on _scale_factor\\
-        relatives to the axis origin
+        Applies scale, rotation and translation to all points in one pass\\
+        only reads the first two coordinates of each point\\
+        long lists of points are transformed with numpy
 
         Parameters
         ----------
-            point : tuple
-                the point to apply the transformation
+            points : list
+                the points to apply the transformation
 
         Returns
         -------
-            list : transformed point
+            list : transformed points
         """
-        point = list(point)
-        new_point = [
-            point[0] * self._scale_factor, point[1] * self._scale_factor
-        ]
-        return new_point
+        a, b, c, d, tx, ty = self._matrix
+        if len(points) >= _NUMPY_THRESHOLD:
+            try:
+                vertexes = np.array(points, dtype=np.float64)[:, :2]
+            except (ValueError, IndexError):
+                pass  # points of different dimensions
+            else:
+                vertexes = vertexes @ np.array(((a, c), (b, d)))
+                vertexes += (tx, ty)
+                return vertexes.tolist()
+        return [(a * p[0] + b * p[1] + tx, c * p[0] + d * p[1] + ty)
+                for p in points]
 
     def line(self, point1: Union[tuple, list, Vector],
              point2: Union[tuple, list, Vector]) -> None:
@@ -674,19 +830,18 @@ class Renderer:
             point2 : tuple | list | Vector
                 second point
         """
-        if self._has_scale:
-            point1 = self._scale_point(point1)
-            point2 = self._scale_point(point2)
-        if self._has_rotation:
-            point1 = self._rotate_point(point1)
-            point2 = self._rotate_point(point2)
-        if self._has_translation:
-            point1 = self._offset_point(point1)
-            point2 = self._offset_point(point2)
+        if self._xform_flags:
+            point1 = self._transform_point(point1)
+            point2 = self._transform_point(point2)
+        else:
+            point1 = _xy(point1)
+            point2 = _xy(point2)
 
-        color = self.stroke
-        weight = self.stroke_weight
-        pygame.draw.line(self._window, color, point1[:2], point2[:2], weight)
+        color = self._stroke_color
+        weight = self._stroke_weight
+        area = pygame.draw.line(self._window, color, point1, point2, weight)
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def aaline(self, point1: Union[tuple, list, Vector],
                point2: Union[tuple, list, Vector]) -> None:
@@ -701,19 +856,16 @@ class Renderer:
             point2 : tuple | list | Vector
                 second point
         """
-        if self._has_scale:
-            point1 = self._scale_point(point1)
-            point2 = self._scale_point(point2)
-        if self._has_rotation:
-            point1 = self._rotate_point(point1)
-            point2 = self._rotate_point(point2)
-        if self._has_translation:
-            point1 = self._offset_point(point1)
-            point2 = self._offset_point(point2)
+        if self._xform_flags:
+            point1 = self._transform_point(point1)
+            point2 = self._transform_point(point2)
 
-        color = self.stroke
-        weight = self.stroke_weight
-        pygame.draw.aaline(self._window, color, point1[:2], point2[:2], weight)
+        color = self._stroke_color
+        weight = self._stroke_weight
+        area = pygame.draw.aaline(self._window, color, _xy(point1),
+                                  _xy(point2), weight)
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def lines(self,
               *points: Union[tuple, list, Vector],
@@ -730,16 +882,15 @@ class Renderer:
                 last point connected to first
                 defaults to True
         """
-        points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._xform_flags:
+            points = self._transform_points(points)
+        else:
+            points = [p[:2] for p in points]
 
-        color = self.stroke
-        pygame.draw.lines(self._window, color, closed, points)
+        color = self._stroke_color
+        area = pygame.draw.lines(self._window, color, closed, points)
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def aalines(self,
                 *points: Union[tuple, list, Vector],
@@ -756,16 +907,15 @@ class Renderer:
                 last point connected to first
                 defaults to True
         """
-        points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._xform_flags:
+            points = self._transform_points(points)
+        else:
+            points = [p[:2] for p in points]
 
-        color = self.stroke
-        pygame.draw.aalines(self._window, color, closed, points)
+        color = self._stroke_color
+        area = pygame.draw.aalines(self._window, color, closed, points)
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def polygon(self, *points: Union[tuple, list, Vector]) -> None:
         """
@@ -777,22 +927,30 @@ class Renderer:
             points : tuples | lists | Vectors
                 each additional arg is a point
         """
-        self._debug_enabled_drawing_methods()
-        points: list[list[float, float]] = [list(p[:2]) for p in points]
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
+        if self._xform_flags:
+            points = self._transform_points(points)
+        else:
+            points = [p[:2] for p in points]
+
+        window = self._window
+        weight = self._stroke_weight
+        # a stroke weight of 0 covers the fill and a negative one draws nothing
+        stroke = self._stroke and weight >= 0
+        fill = self._fill and not (stroke and weight == 0)
 
         # fill
-        if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
+        if fill:
+            area = pygame.draw.polygon(window, self._fill_color, points, 0)
+            if not self._full_redraw:
+                self._mark_dirty(area)
         # stroke
-        if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+        if stroke:
+            area = pygame.draw.polygon(window, self._stroke_color, points,
+                                       weight)
+            if not self._full_redraw:
+                self._mark_dirty(area)
 
     def rect(self, point: Union[tuple, list, Vector], width: int,
              height: int) -> None:
@@ -809,41 +967,13 @@ class Renderer:
             height : int
                 the height of the rectangle
         """
-        self._debug_enabled_drawing_methods()
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
         point = list(point)
-        if self.rect_mode == CENTER:
+        if self._rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        # if self._has_rotation:
-        #     point = self._rotate_point(point)
-        # if self._has_translation:
-        #     point = self._offset_point(point)
-
-        x, y = point[:2]
-        points = [(x, y), (x + width, y), (x + width, y + height),
-                  (x, y + height)]
-
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
-
-        # # fill
-        # if self._fill:
-        #     pygame.draw.rect(self._window, self.fill, (point[:2], (width, height)), 0)
-        # # stroke
-        # if self._stroke:
-        #     pygame.draw.rect(self._window, self.stroke, (point[:2], (width, height)), self.stroke_weight)
-
-        # fill
-        if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
-        # stroke
-        if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+        self._quad(point[0], point[1], width, height)
 
     def square(self, point: Union[tuple, list, Vector], size: int) -> None:
         """
@@ -857,40 +987,78 @@ class Renderer:
             size : int
                 the size of the square
         """
-        self._debug_enabled_drawing_methods()
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
         point = list(point)
-        if self.rect_mode == CENTER:
+        if self._rect_mode == CENTER:
             point[0] -= size // 2
             point[1] -= size // 2
-        # if self._has_rotation:
-        #     point = self._rotate_point(point)
-        # if self._has_translation:
-        #     point = self._offset_point(point)
+        self._quad(point[0], point[1], size, size)
 
-        x, y = point[:2]
-        points = [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+    def _quad(self, x: float, y: float, width: float, height: float) -> None:
+        """
+        Draws a rectangle from its top left corner, used by rect and square\\
+        uses the native ``pygame.draw.rect`` when no transformation is active
 
-        if self._has_scale:
-            points = list(map(self._scale_point, points))
-        if self._has_rotation:
-            points = list(map(self._rotate_point, points))
-        if self._has_translation:
-            points = list(map(self._offset_point, points))
+        Parameters
+        ----------
+            x : float
+                x-coordinate of the top left corner
+            y : float
+                y-coordinate of the top left corner
+            width : float
+                the width of the rectangle
+            height : float
+                the height of the rectangle
+        """
+        points = [(x, y), (x + width, y), (x + width, y + height),
+                  (x, y + height)]
 
-        # # fill
-        # if self._fill:
-        #     pygame.draw.rect(self._window, self.fill, (point[:2], (size, size)), 0)
-        # # stroke
-        # if self._stroke:
-        #     pygame.draw.rect(self._window, self.stroke, (point[:2], (size, size)), self.stroke_weight)
+        window = self._window
+        weight = self._stroke_weight
+        # a stroke weight of 0 covers the fill and a negative one draws nothing
+        stroke = self._stroke and weight >= 0
+        fill = self._fill and not (stroke and weight == 0)
+
+        if not self._xform_flags:
+            # covers the same pixels as the polygon, whose vertexes pygame
+            # truncates toward zero (right and bottom edges included)
+            left, right = sorted((int(x), int(x + width)))
+            top, bottom = sorted((int(y), int(y + height)))
+            rect = left, top, right - left + 1, bottom - top + 1
+            # fill
+            if fill:
+                area = pygame.draw.rect(window, self._fill_color, rect, 0)
+                if not self._full_redraw:
+                    self._mark_dirty(area)
+            # stroke (thicker rect borders do not match polygon outlines, and
+            # borders are drawn on the window edges when clipped)
+            if stroke and (weight == 0 or weight == 1 and left >= 0
+                           and top >= 0 and right < self._width
+                           and bottom < self._height):
+                area = pygame.draw.rect(window, self._stroke_color, rect,
+                                        weight)
+                if not self._full_redraw:
+                    self._mark_dirty(area)
+            elif stroke:
+                area = pygame.draw.polygon(window, self._stroke_color, points,
+                                           weight)
+                if not self._full_redraw:
+                    self._mark_dirty(area)
+            return
 
+        points = self._transform_points(points)
         # fill
-        if self._fill:
-            pygame.draw.polygon(self._window, self.fill, points, 0)
+        if fill:
+            area = pygame.draw.polygon(window, self._fill_color, points, 0)
+            if not self._full_redraw:
+                self._mark_dirty(area)
         # stroke
-        if self._stroke:
-            pygame.draw.polygon(self._window, self.stroke, points,
-                                self.stroke_weight)
+        if stroke:
+            area = pygame.draw.polygon(window, self._stroke_color, points,
+                                       weight)
+            if not self._full_redraw:
+                self._mark_dirty(area)
 
     def ellipse(self, point: Union[tuple, list, Vector], width: int,
                 height: int) -> None:
@@ -907,29 +1075,30 @@ class Renderer:
             height : int
                 the height of the rectangle for the ellipse
         """
-        self._debug_enabled_drawing_methods()
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
         point = list(point)
-        if self.rect_mode == CENTER:
+        if self._rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        if self._has_scale:
-            point = self._scale_point(point)
-            width *= self._scale_factor
-            height *= self._scale_factor
-        if self._has_rotation:
-            point = self._rotate_point(point)
-        if self._has_translation:
-            point = self._offset_point(point)
+        width *= self._matrix_scale
+        height *= self._matrix_scale
+        if self._xform_flags:
+            point = self._transform_point(point)
 
         # fill
         if self._fill:
-            pygame.draw.ellipse(self._window, self.fill,
-                                (point[:2], (width, height)), 0)
+            area = pygame.draw.ellipse(self._window, self._fill_color,
+                                       (point[:2], (width, height)), 0)
+            if not self._full_redraw:
+                self._mark_dirty(area)
         # stroke
         if self._stroke:
-            pygame.draw.ellipse(self._window, self.stroke,
-                                (point[:2], (width, height)),
-                                self.stroke_weight)
+            area = pygame.draw.ellipse(self._window, self._stroke_color,
+                                       (point[:2], (width, height)),
+                                       self._stroke_weight)
+            if not self._full_redraw:
+                self._mark_dirty(area)
 
     def circle(self, center: Union[tuple, list, Vector], radius: int) -> None:
         """
@@ -943,22 +1112,26 @@ class Renderer:
             radius : int
                 circle radius
         """
-        self._debug_enabled_drawing_methods()
-        if self._has_scale:
-            center = self._scale_point(center)
-            radius *= self._scale_factor
-        if self._has_rotation:
-            center = self._rotate_point(center)
-        if self._has_translation:
-            center = self._offset_point(center)
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
+        if self._xform_flags:
+            center = self._transform_point(center)
+            radius *= self._matrix_scale
+        elif type(center) is not tuple or len(center) != 2:
+            center = center[0], center[1]
 
         # fill
         if self._fill:
-            pygame.draw.circle(self._window, self.fill, center[:2], radius, 0)
+            area = pygame.draw.circle(self._window, self._fill_color, center,
+                                      radius, 0)
+            if not self._full_redraw:
+                self._mark_dirty(area)
         # stroke
         if self._stroke:
-            pygame.draw.circle(self._window, self.stroke, center[:2], radius,
-                               self._stroke_weight)
+            area = pygame.draw.circle(self._window, self._stroke_color, center,
+                                      radius, self._stroke_weight)
+            if not self._full_redraw:
+                self._mark_dirty(area)
 
     def arc(self, point: Union[tuple, list, Vector], width: int, height: int,
             start: float, stop: float) -> None:
@@ -979,31 +1152,34 @@ class Renderer:
             stop : float
                 stop angle for the arc
         """
-        self._debug_enabled_drawing_methods()
+        if self._needs_draw_debug:
+            self._debug_enabled_drawing_methods()
         point = list(point)
-        if self.rect_mode == CENTER:
+        if self._rect_mode == CENTER:
             point[0] -= width // 2
             point[1] -= height // 2
-        if self._has_scale:
-            point = self._scale_point(point)
-            width *= self._scale_factor
-            height *= self._scale_factor
+        width *= self._matrix_scale
+        height *= self._matrix_scale
         if self._has_rotation:
-            point = self._rotate_point(point)
             start += self._rot_angle
             stop += self._rot_angle
-        if self._has_translation:
-            point = self._offset_point(point)
+        if self._xform_flags:
+            point = self._transform_point(point)
 
         # fill
         if self._fill:
-            pygame.draw.ellipse(self._window, self.fill,
-                                (point[:2], (width, height)), start, stop, 0)
+            area = pygame.draw.ellipse(self._window, self._fill_color,
+                                       (point[:2], (width, height)), start,
+                                       stop, 0)
+            if not self._full_redraw:
+                self._mark_dirty(area)
         # stroke
         if self._stroke:
-            pygame.draw.ellipse(self._window, self.stroke,
-                                (point[:2], (width, height)), start, stop,
-                                self.stroke_weight)
+            area = pygame.draw.ellipse(self._window, self._stroke_color,
+                                       (point[:2], (width, height)), start,
+                                       stop, self._stroke_weight)
+            if not self._full_redraw:
+                self._mark_dirty(area)
 
     def point(self, point: Union[tuple, list, Vector]) -> None:
         """
@@ -1015,15 +1191,15 @@ class Renderer:
             point : tuple | list | Vector
                 the point coordinates
         """
-        if self._has_scale:
-            point = self._scale_point(point)
-        if self._has_rotation:
-            point = self._rotate_point(point)
-        if self._has_translation:
-            point = self._offset_point(point)
+        if self._xform_flags:
+            point = self._transform_point(point)
+        elif type(point) is not tuple or len(point) != 2:
+            point = point[0], point[1]
 
-        pygame.draw.circle(self._window, self.stroke, point[:2],
-                           self._stroke_weight, 0)
+        area = pygame.draw.circle(self._window, self._stroke_color, point,
+                                  self._stroke_weight, 0)
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def sprites(self, group: pygame.sprite.Group) -> None:
         """
@@ -1036,6 +1212,8 @@ class Renderer:
                 a group of sprites
         """
         group.draw(self._window)
+        # Group.draw does not return the areas it drew on
+        self._full_redraw = True
 
     def load_image(self, path: str) -> pygame.Surface:
         """
@@ -1074,11 +1252,13 @@ class Renderer:
             image : pygame.Surface
                 loaded image
         """
-        if self.rect_mode == CENTER:
+        if self._rect_mode == CENTER:
             dx, dy = self.get_image_size()
             x -= dx / 2
             y -= dy / 2
-        self._window.blit(image, (x, y))
+        area = self._window.blit(image, (x, y))
+        if not self._full_redraw:
+            self._mark_dirty(area)
 
     def text(self, x: int, y: int, text: str) -> None:
         """
@@ -1094,9 +1274,31 @@ class Renderer:
             text : str
                 the text to display
         """
-        color = self.text_color
-        text_label = self.font.render(text, True, color)
-        self._window.blit(text_label, (x, y))
+        key = text, self._text_color, self.font
+        text_label = self._text_cache.get(key)
+        if text_label is None:
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            text_label = self.font.render(text, True, self._text_color)
+            self._text_cache[key] = text_label
+        if self._is_batching:
+            self._pending_blits.append((text_label, (x, y)))
+        else:
+            area = self._window.blit(text_label, (x, y))
+            if not self._full_redraw:
+                self._mark_dirty(area)
+
+    def _flush_blits(self) -> None:
+        """
+        Draws all pending text labels on the screen in a single call
+        """
+        if not self._pending_blits:
+            return
+        if hasattr(self._window, "fblits"):  # pygame-ce
+            self._window.fblits(self._pending_blits)
+        else:
+            self._window.blits(self._pending_blits, doreturn=0)
+        self._pending_blits.clear()
 
     def background(self, *color: Union[int, str]) -> None:
         """
@@ -1109,29 +1311,15 @@ class Renderer:
         """
         if len(color) == 1:
             color = color[0]
-        if isinstance(color, int):
-            color = color, color, color
-        elif isinstance(color, tuple) and len(color) == 3:
-            pass
-        elif isinstance(color, str):
-            try:
-                color = COLORS[color.lower()]
-            except KeyError:
-                close = difflib.get_close_matches(color.lower(),
-                                                  COLORS.keys(),
-                                                  n=1,
-                                                  cutoff=.5)[0]
-                warn(
-                    f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
-                )
-                color = COLORS[close]
-        else:
+        rgb = _resolve_color(color)
+        if rgb is None:
             warn(
                 f"ERROR [renderer] : {color} not a valid color parameter, applaying default dark background"
             )
-            color = 51, 51, 51
-        self._bg = color
-        self._window.fill(color)
+            rgb = 51, 51, 51
+        self._bg = rgb
+        self._window.fill(rgb)
+        self._full_redraw = True
 
     def translate(self, x: float = 0, y: float = 0) -> None:
         """
@@ -1144,10 +1332,10 @@ class Renderer:
             y : float
                 translation for y-axis
         """
-        if self._has_scale:
-            x, y = self._scale_point((x, y))
-        if self._has_rotation:
-            x, y = self._rotate_point((x, y))
+        if self._xform_flags & (_SCALE | _ROTATION):
+            # current scale and rotation, using the cached matrix
+            a, b, c, d = self._matrix[:4]
+            x, y = a * x + b * y, c * x + d * y
 
         self._x_offset += x
         self._y_offset += y
@@ -1155,6 +1343,7 @@ class Renderer:
             self._has_translation = False
         else:
             self._has_translation = True
+        self._update_matrix()
 
     def rotate(self, angle: float) -> None:
         """
@@ -1170,6 +1359,7 @@ class Renderer:
             self._has_rotation = False
         else:
             self._has_rotation = True
+        self._update_matrix()
 
     def rotate_display(self, angle: float) -> None:
         """
@@ -1181,10 +1371,12 @@ class Renderer:
             angle : float
                 angle in radians
         """
-        surface = pygame.transform.rotate(self._window, m.degrees(angle))
-        x = (self.win_width - surface.get_width()) / 2
-        y = (self.win_height - surface.get_height()) / 2
+        surface = pygame.transform.rotate(self._window, angle * _RAD_TO_DEG)
+        width, height = surface.get_size()
+        x = (self._width - width) / 2
+        y = (self._height - height) / 2
         self._window.blit(surface, (x, y))
+        self._full_redraw = True
 
     def scale(self, scale: float) -> None:
         """
@@ -1206,6 +1398,7 @@ class Renderer:
             self._has_scale = False
         else:
             self._has_scale = True
+        self._update_matrix()
 
     def scale_display(self, scale: float) -> None:
         """
@@ -1217,10 +1410,25 @@ class Renderer:
             scale : float
                 scale (zoom factor, must be positive)
         """
-        surface = pygame.transform.rotozoom(self._window, 0, scale)
-        x = (self.win_width - surface.get_width()) / 2
-        y = (self.win_height - surface.get_height()) / 2
+        if scale <= 0:
+            warn(
+                f"ERROR [renderer] : scale must be positive, not {scale}, nothing happened"
+            )
+            return
+        if scale == 1:
+            # rotozoom would only blur the window
+            return
+        if scale > 1:
+            # bilinear scaling, about twice as fast as rotozoom when zooming in
+            size = int(self._width * scale), int(self._height * scale)
+            surface = pygame.transform.smoothscale(self._window, size)
+        else:
+            surface = pygame.transform.rotozoom(self._window, 0, scale)
+        width, height = surface.get_size()
+        x = (self._width - width) / 2
+        y = (self._height - height) / 2
         self._window.blit(surface, (x, y))
+        self._full_redraw = True
 
     def reset_matrix(self) -> None:
         """
@@ -1238,25 +1446,37 @@ class Renderer:
 
     def _reset_translation(self) -> None:
         """
-        resets the axis origin back to normal
+        resets the axis origin back to normal\\
+        does nothing if there is no translation
         """
+        if not self._has_translation:
+            return
         self._has_translation = False
         self._x_offset = 0
         self._y_offset = 0
+        self._update_matrix()
 
     def _reset_rotation(self) -> None:
         """
-        resets rotation angle back to 0
+        resets rotation angle back to 0\\
+        does nothing if there is no rotation
         """
+        if not self._has_rotation:
+            return
         self._has_rotation = False
         self._rot_angle = 0
+        self._update_matrix()
 
     def _reset_scale(self) -> None:
         """
-        resets scale factor back to 1
+        resets scale factor back to 1\\
+        does nothing if there is no scale
         """
+        if not self._has_scale:
+            return
         self._has_scale = False
         self._scale_factor = 1
+        self._update_matrix()
 
     @property
     def translation_behavior(self) -> str:
@@ -1281,6 +1501,7 @@ class Renderer:
             )
             return
         self._translation_behavior = behavior
+        self._resets_translation = behavior == RESET
 
     @property
     def rotation_behavior(self) -> str:
@@ -1305,6 +1526,7 @@ class Renderer:
             )
             return
         self._rotation_behavior = behavior
+        self._resets_rotation = behavior == RESET
 
     @property
     def scale_behavior(self) -> str:
@@ -1329,6 +1551,97 @@ class Renderer:
             )
             return
         self._scale_behavior = behavior
+        self._resets_scale = behavior == RESET
+
+    def _update_visible_widgets(self) -> None:
+        """
+        Rebuilds the lists of buttons, sliders and menus that are not hidden\\
+        must be called every time a widget is added, removed, hidden or revealed
+        """
+        self._visible_buttons = [
+            button for button in self._all_buttons if not button.is_hidden
+        ]
+        self._visible_sliders = [
+            slider for slider in self._all_sliders if not slider.is_hidden
+        ]
+        self._visible_menus = [
+            menu for menu in self._all_menus if not menu.is_hidden
+        ]
+
+    def _find_by_name(self, index: dict[str, list], name: str, kind: str):
+        """
+        gets the last added sprite of a name index\\
+        warns if not matched or if several sprites share the name
+
+        Parameters
+        ----------
+            index : dict
+                name index of the sprite kind
+            name : str
+                name of the sprite to get
+            kind : str
+                sprite kind, used in warnings
+
+        Returns
+        -------
+            Button | Slider | Menu | None : matching sprite if found
+        """
+        bucket = index.get(name)
+        if not bucket:
+            warn(f"WARNING [renderer] : no matching {kind}")
+            return None
+        if len(bucket) >= 2:
+            warn(
+                "WARNING [renderer] : to many matches - considering last found"
+            )
+        return bucket[-1]
+
+    def _unindex(self, index: dict[str, list], sprite) -> None:
+        """
+        removes a sprite from a name index\\
+        drops the name once no sprite uses it anymore
+
+        Parameters
+        ----------
+            index : dict
+                name index of the sprite kind
+            sprite : Button | Slider | Menu
+                the sprite to remove
+        """
+        bucket = index.get(sprite.name)
+        if bucket is not None and sprite in bucket:
+            bucket.remove(sprite)
+            if not bucket:
+                del index[sprite.name]
+
+    def _rename_widget(self, sprite, old_name: str) -> None:
+        """
+        moves a renamed sprite to its new name in the name index\\
+        does nothing if the sprite is not living
+
+        Parameters
+        ----------
+            sprite : Button | Slider | Menu
+                the renamed sprite
+            old_name : str
+                name of the sprite before renaming
+        """
+        if isinstance(sprite, Button):
+            index, sprites = self._buttons_by_name, self._all_buttons
+        elif isinstance(sprite, Slider):
+            index, sprites = self._sliders_by_name, self._all_sliders
+        else:
+            index, sprites = self._menus_by_name, self._all_menus
+
+        bucket = index.get(old_name)
+        if bucket is None or not any(s is sprite for s in bucket):
+            return
+        bucket.remove(sprite)
+        if not bucket:
+            del index[old_name]
+        # keeps the bucket in creation order, the last one being matched
+        name = sprite.name
+        index[name] = [s for s in sprites if s.name == name]
 
     def _add_button(self, button: Button) -> None:
         """
@@ -1339,7 +1652,9 @@ class Renderer:
             button : Button
                 new button
         """
-        self._all_buttons.add(button)
+        self._all_buttons.append(button)
+        self._buttons_by_name.setdefault(button.name, []).append(button)
+        self._update_visible_widgets()
 
     def create_button(self, x: int, y: int, name: str, **kwargs) -> Button:
         """
@@ -1398,6 +1713,8 @@ class Renderer:
         """
         if button is not None:
             self._all_buttons.remove(button)
+            self._unindex(self._buttons_by_name, button)
+            self._update_visible_widgets()
             if len(self._all_buttons) == 0:
                 self._has_buttons = False
 
@@ -1415,18 +1732,7 @@ class Renderer:
         -------
             Button : matching button
         """
-        sprite = None
-        found = 0
-        for button in self._all_buttons:
-            if button.name == name:
-                sprite = button
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching button")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._buttons_by_name, name, "button")
         return sprite
 
     def kill_button(self, name: str) -> None:
@@ -1440,18 +1746,7 @@ class Renderer:
             name : str
                 name of the button to remove
         """
-        sprite = None
-        found = 0
-        for button in self._all_buttons:
-            if button.name == name:
-                sprite = button
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching button")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._buttons_by_name, name, "button")
         self._remove_button(sprite)
 
     def pop_button(self, name: str) -> Button:
@@ -1469,18 +1764,7 @@ class Renderer:
         -------
             Button | None : matched button if found
         """
-        sprite = None
-        found = 0
-        for button in self._all_buttons:
-            if button.name == name:
-                sprite = button
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching button")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._buttons_by_name, name, "button")
         self._remove_button(sprite)
         return sprite
 
@@ -1493,7 +1777,9 @@ class Renderer:
             slider : Slider
                 new slider
         """
-        self._all_sliders.add(slider)
+        self._all_sliders.append(slider)
+        self._sliders_by_name.setdefault(slider.name, []).append(slider)
+        self._update_visible_widgets()
 
     def create_slider(self, x: int, y: int, name: str, min: float, max: float,
                       value: float, incr: int, **kwargs) -> Slider:
@@ -1558,6 +1844,8 @@ class Renderer:
         """
         if slider is not None:
             self._all_sliders.remove(slider)
+            self._unindex(self._sliders_by_name, slider)
+            self._update_visible_widgets()
             if len(self._all_sliders) == 0:
                 self._has_sliders = False
 
@@ -1575,18 +1863,7 @@ class Renderer:
         -------
             Slider : matching slider
         """
-        sprite = None
-        found = 0
-        for slider in self._all_sliders:
-            if slider.name == name:
-                sprite = slider
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching slider")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._sliders_by_name, name, "slider")
         return sprite
 
     def kill_slider(self, name: str) -> None:
@@ -1600,18 +1877,7 @@ class Renderer:
             name : str
                 name of the slider to remove
         """
-        sprite = None
-        found = 0
-        for slider in self._all_sliders:
-            if slider.name == name:
-                sprite = slider
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching slider")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._sliders_by_name, name, "slider")
         self._remove_slider(sprite)
 
     def pop_slider(self, name: str) -> Button:
@@ -1629,18 +1895,7 @@ class Renderer:
         -------
             Slider | None : matched slider if found
         """
-        sprite = None
-        found = 0
-        for slider in self._all_sliders:
-            if slider.name == name:
-                sprite = slider
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching slider")
-        elif found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._sliders_by_name, name, "slider")
         self._remove_slider(sprite)
         return sprite
 
@@ -1658,20 +1913,9 @@ class Renderer:
         -------
             float | None : the current value of the slider
         """
-        sprite = None
-        found = 0
-        for slider in self._all_sliders:
-            if slider.name == name:
-                sprite = slider
-                found += 1
-        if found == 0:
-            warn("WARNING [renderer] : no matching slider")
-            return
-        if found >= 2:
-            warn(
-                "WARNING [renderer] : to many matches - considering last found"
-            )
-        return sprite.value
+        sprite = self._find_by_name(self._sliders_by_name, name, "slider")
+        if sprite is not None:
+            return sprite.value
 
     def _add_menu(self, menu: Menu) -> None:
         """
@@ -1682,7 +1926,10 @@ class Renderer:
             menu : Menu
                 new menu
         """
-        self._all_menus.add(menu)
+        self._all_menus.append(menu)
+        self._menu_count += 1
+        self._menus_by_name.setdefault(menu.name, []).append(menu)
+        self._update_visible_widgets()
 
     def create_menu(self, name: str, **kwargs) -> Menu:
         """
@@ -1723,18 +1970,17 @@ class Renderer:
         menu = Menu(self, name, **kwargs)
         if menu.has_error:
             return
-        if (menu.side == LEFT
-                and self._has_left_menu) or (menu.side == RIGHT
-                                             and self._has_right_menu):
+        if (menu.side == LEFT and self._left_menu is not None) or (
+                menu.side == RIGHT and self._right_menu is not None):
             warn(
                 f"ERROR [renderer] : already have a {menu.side} menu, try again by changing side"
             )
             return
         self._add_menu(menu)
         if menu.side == LEFT:
-            self._has_left_menu = True
+            self._left_menu = menu
         elif menu.side == RIGHT:
-            self._has_right_menu = True
+            self._right_menu = menu
         return menu
 
     def _remove_menu(self, menu: Menu) -> None:
@@ -1748,12 +1994,14 @@ class Renderer:
                 the menu to remove
         """
         if menu is not None:
-            self._all_sliders.remove(menu)
-            if len(self._all_sliders) == 0:
-                if menu.side == LEFT:
-                    self._has_left_menu = False
-                elif menu.side == RIGHT:
-                    self._has_right_menu = False
+            self._all_menus.remove(menu)
+            self._unindex(self._menus_by_name, menu)
+            self._update_visible_widgets()
+            self._menu_count -= 1
+            if menu is self._left_menu:
+                self._left_menu = None
+            elif menu is self._right_menu:
+                self._right_menu = None
 
     def get_menu(self, name: str) -> Menu:
         """
@@ -1769,18 +2017,7 @@ class Renderer:
         -------
             Menu : matching menu
         """
-        sprite = None
-        found = 0
-        for menu in self._all_menus:
-            if menu.name == name:
-                sprite = menu
-                found += 1
-        if found == 0:
-            warn(f"WARNING [renderer] : no matching menu")
-        elif found >= 2:
-            warn(
-                f"WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._menus_by_name, name, "menu")
         return sprite
 
     def kill_menu(self, name: str) -> None:
@@ -1794,18 +2031,7 @@ class Renderer:
             name : str
                 name of the menu to remove
         """
-        sprite = None
-        found = 0
-        for menu in self._all_menus:
-            if menu.name == name:
-                sprite = menu
-                found += 1
-        if found == 0:
-            warn(f"WARNING [renderer] : no matching menu")
-        elif found >= 2:
-            warn(
-                f"WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._menus_by_name, name, "menu")
         self._remove_menu(sprite)
 
     def pop_menu(self, name: str) -> Menu:
@@ -1823,18 +2049,7 @@ class Renderer:
         -------
             Menu | None : matching menu if found
         """
-        sprite = None
-        found = 0
-        for menu in self._all_menus:
-            if menu.name == name:
-                sprite = menu
-                found += 1
-        if found == 0:
-            warn(f"WARNING [renderer] : no matching menu")
-        elif found >= 2:
-            warn(
-                f"WARNING [renderer] : to many matches - considering last found"
-            )
+        sprite = self._find_by_name(self._menus_by_name, name, "menu")
         self._remove_menu(sprite)
         return sprite
 
@@ -1917,10 +2132,40 @@ class Renderer:
         self._remove_scrollbar()
         return sprite
 
+    def _mark_dirty(self, area: pygame.Rect) -> None:
+        """
+        Records an area drawn on the window\\
+        switches to a full update once there are too many areas
+
+        Parameters
+        ----------
+            area : pygame.Rect
+                the area drawn on
+        """
+        dirty_rects = self._dirty_rects
+        dirty_rects.append(area)
+        if len(dirty_rects) >= _DIRTY_RECTS_LIMIT:
+            dirty_rects.clear()
+            self._full_redraw = True
+
+    def _update_display(self) -> None:
+        """
+        Updates the areas of the window drawn since the last update\\
+        flips the whole window when they can not be tracked or are too many
+        """
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
+        self._dirty_rects.clear()
+
     @staticmethod
     def _events() -> list:
         """
-        gets all events
+        gets all events\\
+        pumps and drains the event queue in a single call\\
+        the main loop only calls this once per frame
         """
         return pygame.event.get()
 
@@ -1953,6 +2198,11 @@ class Renderer:
                 frames per second
         """
         self._fps = frames
+        # SDL_Delay is too coarse for short frames, busy loop only for those
+        if frames >= _BUSY_LOOP_FPS:
+            self._tick = self._clock.tick_busy_loop
+        else:
+            self._tick = self._clock.tick
 
     def push(self) -> None:
         """
@@ -1960,14 +2210,16 @@ class Renderer:
         does not affect outer objects\\
         use ``pop`` to reset the state
         """
-        self._save.append([
-            self.fill, self._fill, self.stroke, self.stroke_weight,
-            self._stroke, self._has_translation, self._x_offset,
-            self._y_offset, self._has_rotation, self._rot_angle,
-            self._has_scale, self._scale_factor, self.rect_mode,
-            self.translation_behavior, self.rotation_behavior,
-            self.scale_behavior, self.text_color, self.text_size
-        ])
+        self._save.append(
+            _RendererState(self._fill_color, self._fill, self._stroke_color,
+                           self._stroke_weight, self._stroke,
+                           self._has_translation, self._x_offset,
+                           self._y_offset, self._has_rotation,
+                           self._rot_angle, self._has_scale,
+                           self._scale_factor, self._rect_mode,
+                           self._translation_behavior,
+                           self._rotation_behavior, self._scale_behavior,
+                           self._text_color, self._text_size))
         self._has_save = True
 
     def pop(self) -> None:
@@ -1982,15 +2234,17 @@ class Renderer:
         self.fill, self._fill, self.stroke, self.stroke_weight, self._stroke, self._has_translation,self._x_offset, self._y_offset, self._has_rotation, self._rot_angle, self._has_scale, self._scale_factor,self.rect_mode, self.translation_behavior, self.rotation_behavior, self.scale_behavior, self.text_color, self.text_size =\
             self._save.pop()
         self._has_save = len(self._save) >= 1
+        self._needs_draw_debug = not (self._stroke or self._fill)
+        self._update_matrix()
 
     @property
-    def key_binding(self) -> dict[int, int]:
+    def key_binding(self) -> dict[int, Callable[[], None]]:
         """
         gets current state of the Renderer key binding\\
         dict keys are keyboard keys identifiers (also used by pygame)\\
-        dict values are indexes for bound function (actions property)
+        dict values are the bound functions
         """
-        return self._key_binding
+        return self._key_actions
 
     def new_keypress(self,
                      key: int,
@@ -2011,7 +2265,7 @@ class Renderer:
                 PRESSED | RELEASED | HOLD
                 defaults to PRESSED
         """
-        if key in self.key_binding:
+        if key in self._key_actions:
             warn(
                 f"ERROR [renderer] : {key} is already assigned to a function, try update_key instead"
             )
@@ -2021,9 +2275,8 @@ class Renderer:
                 f"ERROR [renderer] : {behavior} is not a valid key behavior, nothing happened"
             )
             return
-        self._actions.append(action)
-        self._keys_behavior.append(behavior)
-        self._key_binding[key] = len(self._actions) - 1
+        self._key_actions[key] = action
+        self._key_behaviors[key] = behavior
 
     def update_keypress(self,
                         key: int,
@@ -2044,7 +2297,7 @@ class Renderer:
                 PRESSED | RELEASED | HOLD
                 defaults to None
         """
-        if key not in self.key_binding:
+        if key not in self._key_actions:
             warn(
                 f"ERROR [renderer] : {key} is not assigned to an existing function, try new_key instead"
             )
@@ -2054,15 +2307,14 @@ class Renderer:
                 f"ERROR [renderer] : {behavior} is not a valid key behavior, nothing changed"
             )
             return
-        i = self._key_binding[key]
-        self._actions[i] = action
+        self._key_actions[key] = action
         if behavior is not None:
-            self._keys_behavior[i] = behavior
+            self._key_behaviors[key] = behavior
 
     def kill_keypress(self, key: int) -> None:
         """
         removes the action of a given key\\
-        changes the action to ``lambda: None`` and pops key binding\\
+        pops the key action and behavior\\
         leaves other keys action unchanged\\
         no action will be performed when the given key is pressed\\
         please use ``Renderer.keys.`` to find keys
@@ -2072,18 +2324,14 @@ class Renderer:
             key : int
                 keyboard key identifier
         """
-        if key not in self.key_binding:
+        if key not in self._key_actions:
             warn(
                 f"ERROR [renderer] : {key} is not assigned to an existing function, can not kill"
             )
             return
-        i = self._key_binding[key]
-        self._actions[i] = lambda: None
-        self._key_binding.pop(key)
-        try:
-            self._pressed.pop(key)
-        except KeyError:
-            pass
+        del self._key_actions[key]
+        del self._key_behaviors[key]
+        self._held_keys.discard(key)
 
     def load_pixels(self) -> None:
         """
@@ -2109,14 +2357,17 @@ class Renderer:
             return
         self._is_p_loaded = False
         self._pixels.close()
+        self._full_redraw = True
 
     def set_at(self, x: int, y: int) -> None:
         """
         sets a pixel at a given position\\
         uses stroke color even if stroking is disabled
         """
-        color = self.stroke
+        color = self._stroke_color
         self._window.set_at((x, y), color)
+        if not self._full_redraw:
+            self._mark_dirty((x, y, 1, 1))
 
     def flip(self) -> None:
         """
@@ -2124,6 +2375,8 @@ class Renderer:
         used for interractive drawing without the draw main loop
         """
         pygame.display.flip()
+        self._full_redraw = False
+        self._dirty_rects.clear()
 
     def start(self) -> None:
         """
@@ -2132,6 +2385,7 @@ class Renderer:
         """
         self._window = pygame.display.set_mode((self._width, self._height))
         pygame.display.set_caption(self._title)
+        self._full_redraw = True
 
     def quit(self) -> None:
         """
@@ -2176,28 +2430,13 @@ class Renderer:
             self._has_auto_bg = False
             return
 
-        if isinstance(color, int):
-            color = color, color, color
-        elif isinstance(color, tuple) and len(color) == 3:
-            pass
-        elif isinstance(color, str):
-            try:
-                color = COLORS[color.lower()]
-            except KeyError:
-                close = difflib.get_close_matches(color.lower(),
-                                                  COLORS.keys(),
-                                                  n=1,
-                                                  cutoff=.5)[0]
-                warn(
-                    f"ERROR [renderer] : {color} is not a valid color name, using closest match {close} instead"
-                )
-                color = COLORS[close]
-        else:
+        rgb = _resolve_color(color)
+        if rgb is None:
             warn(
                 f"ERROR [renderer] : {color} not a valid color parameter, applaying default dark background"
             )
-            color = 51, 51, 51
-        self._bg = color
+            rgb = 51, 51, 51
+        self._bg = rgb
 
     def run(self,
             draw: Callable[[], None] = None,
@@ -2236,46 +2475,133 @@ class Renderer:
                 )
         setup()
 
+        # each loop returns when the bench mode is toggled, if draw did it
+        # the other loop finishes that frame without drawing it again
+        drawn = False
         while self._is_running:
-            # drawing loop
-            if self._has_auto_bg:
-                self._window.fill(self._bg)
-            draw()
-
-            # translation, rotation, scale management
-            if self.translation_behavior == RESET:
-                self._reset_translation()
-            if self.rotation_behavior == RESET:
-                self._reset_rotation()
-            if self.scale_behavior == RESET:
-                self._reset_scale()
-
-            # bench mode
             if self._benchmark:
-                pygame.display.flip()
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self._is_running = False
-                        break
-                continue
-
-            # button management
-            if self._has_buttons:
-                for button in self._all_buttons:
-                    if not button.is_hidden:
-                        button.draw()
-
-            # slider management
-            if self._has_sliders:
-                for slider in self._all_sliders:
-                    if not slider.is_hidden:
-                        slider.draw()
-
-            # menu management
-            if self._has_left_menu or self._has_right_menu:
-                for menu in self._all_menus:
-                    if not menu.is_hidden:
-                        menu.draw()
+                drawn = self._run_bench(draw, drawn)
+            else:
+                drawn = self._run_normal(draw, drawn)
+        self.quit()
+
+    def _draw_frame(self, draw: Callable[[], None]) -> None:
+        """
+        Draws a frame and resets transformations if needed
+
+        Parameters
+        ----------
+            draw : python function
+                the main draw function
+        """
+        if self._has_auto_bg:
+            self._window.fill(self._bg)
+            self._full_redraw = True
+        draw()
+
+        # translation, rotation, scale management
+        if self._resets_translation:
+            self._reset_translation()
+        if self._resets_rotation:
+            self._reset_rotation()
+        if self._resets_scale:
+            self._reset_scale()
+
+    def _run_bench(self, draw: Callable[[], None], drawn: bool) -> bool:
+        """
+        Main loop in bench mode\\
+        only draws and looks for the ``QUIT`` event
+
+        Parameters
+        ----------
+            draw : python function
+                the main draw function
+            drawn : bool
+                whether the current frame was already drawn
+
+        Returns
+        -------
+            bool : whether the bench mode was left while drawing a frame
+        """
+        get_events = self._events
+        QUIT = pygame.QUIT
+
+        while self._is_running and self._benchmark:
+            if drawn:
+                drawn = False
+            else:
+                self._draw_frame(draw)
+                if not self._benchmark:
+                    return True
+
+            self._update_display()
+            for event in get_events():
+                if event.type == QUIT:
+                    self._is_running = False
+                    break
+        return False
+
+    def _run_normal(self, draw: Callable[[], None], drawn: bool) -> bool:
+        """
+        Main loop\\
+        draws and manages widgets, keys and frame rate
+
+        Parameters
+        ----------
+            draw : python function
+                the main draw function
+            drawn : bool
+                whether the current frame was already drawn
+
+        Returns
+        -------
+            bool : whether the bench mode was entered while drawing a frame
+        """
+        # names used every frame, resolved once
+        get_events = self._events
+        get_mouse_pos = pygame.mouse.get_pos
+        get_mouse_pressed = pygame.mouse.get_pressed
+        QUIT, MOUSEBUTTONDOWN = pygame.QUIT, pygame.MOUSEBUTTONDOWN
+        KEYUP, KEYDOWN = pygame.KEYUP, pygame.KEYDOWN
+        key_actions = self._key_actions
+        key_behaviors = self._key_behaviors
+        held_keys = self._held_keys
+
+        while self._is_running and not self._benchmark:
+            # widgets draw straight on the window, their areas are not tracked
+            # (set before drawing so the frame does not record areas at all)
+            if (self._has_buttons or self._has_sliders or self._menu_count
+                    or self._has_scrollbar):
+                self._full_redraw = True
+
+            if drawn:
+                drawn = False
+            else:
+                self._draw_frame(draw)
+                if self._benchmark:
+                    return True
+
+            # labels of an element are blitted together, right after its own
+            # shapes so that overlapping elements keep their order
+            self._is_batching = True
+            try:
+                # button management
+                for button in self._visible_buttons:
+                    button.draw()
+                    self._flush_blits()
+
+                # slider management
+                for slider in self._visible_sliders:
+                    slider.draw()
+                    self._flush_blits()
+
+                # menu management
+                for menu in self._visible_menus:
+                    menu.draw()
+                    self._flush_blits()
+            finally:
+                self._is_batching = False
+                self._flush_blits()
 
             # scrollbar management
             if self._has_scrollbar:
@@ -2284,98 +2610,97 @@ class Renderer:
                     scrollbar.draw()
                     self._has_translation = True
                     value = scrollbar.value
-                    if self.translation_behavior == RESET:
+                    if self._resets_translation:
                         self._y_offset -= value
-                    elif self.translation_behavior == KEEP:
+                    else:
                         self._y_offset += self._ps_value
                         self._y_offset -= value
                     self._ps_value = value
+                    self._update_matrix()
 
             # trigerring buttons, sliders and menus
-            pos: tuple[int, int] = pygame.mouse.get_pos()
-            if pygame.mouse.get_pressed()[0] != 0:
-
-                if self._has_buttons:
-                    for button in self._all_buttons:
-                        if not button.is_hidden and button.collide(
-                                pos) and button.check_click():
+            # (mouse state is not polled when there is nothing to trigger)
+            if (self._has_buttons or self._has_sliders or self._menu_count
+                    or self._has_scrollbar):
+                pos: tuple[int, int] = get_mouse_pos()
+                if get_mouse_pressed()[0] != 0:
+
+                    for button in self._visible_buttons:
+                        if button.collide(pos) and button.check_click():
                             button.on_press()
                             button.reinit_click()
 
-                if self._has_sliders:
-                    for slider in self._all_sliders:
-                        if not slider.is_hidden and slider.collide(pos):
+                    for slider in self._visible_sliders:
+                        if slider.collide(pos):
                             slider.set_value(pos)
                             slider.reinit_click()
 
-                if self._has_left_menu or self._has_right_menu:
-                    for menu in self._all_menus:
-                        if not menu.is_hidden and menu.check_click():
+                    for menu in self._visible_menus:
+                        if menu.check_click():
                             menu.update_state(pos)
                             if (i := menu.collide(pos)) is not None:
                                 menu.trigger(i)
                             menu.reinit_click()
 
-                if self._has_scrollbar:
-                    scrollbar = self._scrollbar
-                    if not scrollbar.is_hidden and scrollbar.collide(pos):
-                        if not scrollbar.is_pinned():
-                            scrollbar.set_pin(pos)
-                        else:
-                            scrollbar.set_value_by_y(pos[1] -
-                                                     scrollbar.get_pin())
+                    if self._has_scrollbar:
+                        scrollbar = self._scrollbar
+                        if not scrollbar.is_hidden and scrollbar.collide(pos):
+                            if not scrollbar.is_pinned():
+                                scrollbar.set_pin(pos)
+                            else:
+                                scrollbar.set_value_by_y(pos[1] -
+                                                         scrollbar.get_pin())
+
+                else:
+                    if self._has_buttons:
+                        for button in self._all_buttons:
+                            button.click()
+                    if self._has_sliders:
+                        for slider in self._all_sliders:
+                            slider.click()
+                    if self._menu_count:
+                        for menu in self._all_menus:
+                            menu.click()
+                    if self._has_scrollbar:
+                        scrollbar = self._scrollbar
+                        scrollbar.update_state(pos)
+                        scrollbar.unpin()
 
-            else:
-                if self._has_buttons:
-                    for button in self._all_buttons:
-                        button.click()
-                if self._has_sliders:
-                    for slider in self._all_sliders:
-                        slider.click()
-                if self._has_left_menu or self._has_right_menu:
-                    for menu in self._all_menus:
-                        menu.click()
-                if self._has_scrollbar:
-                    scrollbar = self._scrollbar
-                    scrollbar.update_state(pos)
-                    scrollbar.unpin()
-
-            # quit event and keys
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            # quit event and keys, dispatched in a single pass
+            for event in get_events():
+                event_type = event.type
+                if event_type == QUIT:
                     self._is_running = False
 
-                if event.type == pygame.MOUSEBUTTONDOWN:
+                elif event_type == MOUSEBUTTONDOWN:
                     if self._has_scrollbar:
                         scrollbar = self._scrollbar
                         if event.button == 4:
                             scrollbar.scroll_up()
-                        if event.button == 5:
+                        elif event.button == 5:
                             scrollbar.scroll_down()
 
-                if event.type == pygame.KEYUP:
-                    if (k := event.key) in self.key_binding:
-                        i = self._key_binding[k]
+                elif event_type == KEYUP:
+                    if (k := event.key) in key_actions:
+                        behavior = key_behaviors[k]
 
-                        if self._keys_behavior[i] == RELEASED:
-                            self._actions[i]()
-                        elif self._keys_behavior[i] == HOLD:
-                            self._pressed[k] = False
+                        if behavior == RELEASED:
+                            key_actions[k]()
+                        elif behavior == HOLD:
+                            held_keys.discard(k)
 
-                elif event.type == pygame.KEYDOWN:
-                    if (k := event.key) in self.key_binding:
-                        i = self._key_binding[k]
+                elif event_type == KEYDOWN:
+                    if (k := event.key) in key_actions:
+                        behavior = key_behaviors[k]
 
-                        if self._keys_behavior[i] == PRESSED:
-                            self._actions[i]()
-                        elif self._keys_behavior[i] == HOLD:
-                            self._pressed[k] = True
+                        if behavior == PRESSED:
+                            key_actions[k]()
+                        elif behavior == HOLD:
+                            held_keys.add(k)
 
-                for k in self._pressed:
-                    if self._pressed[k]:
-                        i = self._key_binding[k]
-                        self._actions[i]()
+                for k in held_keys:
+                    key_actions[k]()
 
-            self._clock.tick(self._fps)
-            pygame.display.flip()
-        self.quit()
+            self._tick(self._fps)
+            self._update_display()
+        return False
@@ -527,3 +527,5 @@ class SandBox:
         usefull for debuging
         """
         self._space.debug_draw(self._draw_options)
+        # pymunk draws straight on the window, the renderer can not track it
+        self._renderer._full_redraw = True
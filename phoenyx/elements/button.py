@@ -207,6 +207,7 @@ class Button:
         forces the display state of the button
         """
         self._is_hidden = value
+        self._renderer._update_visible_widgets()
 
     @property
     def shape(self) -> str:
@@ -369,6 +370,7 @@ class Button:
             )
             return
         self._is_hidden = True
+        self._renderer._update_visible_widgets()
 
     def reveal(self) -> None:
         """
@@ -382,6 +384,7 @@ class Button:
             )
             return
         self._is_hidden = False
+        self._renderer._update_visible_widgets()
 
     def move_to(self, x: int = None, y: int = None) -> None:
         """
@@ -439,7 +442,9 @@ class Button:
                 new name
         """
         warn(f"INFO [button {self._name}] : name changing to {name}")
+        old_name = self._name
         self._name = name
+        self._renderer._rename_widget(self, old_name)
 
     @property
     def action(self):
@@ -211,6 +211,7 @@ class Menu:
         forces the display state of the menu
         """
         self._is_hidden = value
+        self._renderer._update_visible_widgets()
 
     def hide(self) -> None:
         """
@@ -224,6 +225,7 @@ class Menu:
             )
             return
         self._is_hidden = True
+        self._renderer._update_visible_widgets()
 
     def reveal(self) -> None:
         """
@@ -237,6 +239,7 @@ class Menu:
             )
             return
         self._is_hidden = False
+        self._renderer._update_visible_widgets()
 
     def move_to(self, side: str) -> None:
         """
@@ -476,7 +479,9 @@ class Menu:
                 new name
         """
         warn(f"INFO [button {self._name}] : name changing to {name}")
+        old_name = self._name
         self._name = name
+        self._renderer._rename_widget(self, old_name)
 
     @property
     def is_fold(self) -> bool:
@@ -358,6 +358,7 @@ class Slider:
         forces display state of the slider
         """
         self._is_hidden = value
+        self._renderer._update_visible_widgets()
 
     def hide(self) -> None:
         """
@@ -371,6 +372,7 @@ class Slider:
             )
             return
         self._is_hidden = True
+        self._renderer._update_visible_widgets()
 
     def reveal(self) -> None:
         """
@@ -384,6 +386,7 @@ class Slider:
             )
             return
         self._is_hidden = False
+        self._renderer._update_visible_widgets()
 
     def move_to(self, x: int = None, y: int = None) -> None:
         """
@@ -436,7 +439,9 @@ class Slider:
                 new name
         """
         warn(f"INFO [slider {self._name}] : name changing to {name}")
+        old_name = self._name
         self._name = name
+        self._renderer._rename_widget(self, old_name)
 
     @property
     def thickness(self) -> int: